@@ -53,21 +53,37 @@ class OsdMap(VersionedSyncObject):
     def __init__(self, version, data):
         super(OsdMap, self).__init__(version, data)
         if data is not None:
-            self.osds_by_id = dict([(o['osd'], o) for o in data['osds']])
-            self.pools_by_id = dict([(p['pool'], p) for p in data['pools']])
-            self.osd_tree_node_by_id = dict([(o['id'], o) for o in data['tree']['nodes'] if o['id'] >= 0])
-
             # Special case Yuck
             flags = data.get('flags', '').replace('pauserd,pausewr', 'pause')
             tokenized_flags = flags.split(',')
 
             self.flags = dict([(x, x in tokenized_flags) for x in OSD_FLAGS])
         else:
-            self.osds_by_id = {}
-            self.pools_by_id = {}
-            self.osd_tree_node_by_id = {}
             self.flags = dict([(x, False) for x in OSD_FLAGS])
 
+    # The id-to-entry indices are built lazily: most consumers of an OsdMap
+    # only touch one or two of them.
+    @property
+    @memoize
+    def osds_by_id(self):
+        if self.data is None:
+            return {}
+        return dict([(o['osd'], o) for o in self.data['osds']])
+
+    @property
+    @memoize
+    def pools_by_id(self):
+        if self.data is None:
+            return {}
+        return dict([(p['pool'], p) for p in self.data['pools']])
+
+    @property
+    @memoize
+    def osd_tree_node_by_id(self):
+        if self.data is None:
+            return {}
+        return dict([(o['id'], o) for o in self.data['tree']['nodes'] if o['id'] >= 0])
+
     @memoize
     def get_tree_nodes_by_id(self):
         return dict((n["id"], n) for n in self.data['tree']["nodes"])
@@ -1,11 +1,24 @@
+from functools import wraps
+
+
 def memoize(function):
-    memo = {}
+    """
+    Cache a method's return value on the instance, so that the cached
+    values are released when the instance is.  Only used on methods, and
+    assumes any extra arguments are hashable.
+    """
+    @wraps(function)
+    def wrapper(self, *args):
+        try:
+            memo = self._memoize_cache
+        except AttributeError:
+            memo = self._memoize_cache = {}
 
-    def wrapper(*args):
-        if args in memo:
-            return memo[args]
+        key = (function.__name__,) + args
+        if key in memo:
+            return memo[key]
         else:
-            rv = function(*args)
-            memo[args] = rv
+            rv = function(self, *args)
+            memo[key] = rv
             return rv
     return wrapper
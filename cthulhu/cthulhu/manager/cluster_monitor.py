@@ -7,6 +7,7 @@ import gevent.greenlet
 import gevent.event
 
 from calamari_common.salt_wrapper import condition_kwarg, LocalClient, SaltEventSource
+from calamari_common.util import memoize
 
 from cthulhu.gevent_util import nosleep, nosleep_mgr
 from cthulhu.log import log
@@ -20,6 +21,9 @@ from cthulhu.util import now
 
 FAVORITE_TIMEOUT_FACTOR = int(config.get('cthulhu', 'favorite_timeout_factor'))
 
+# Compiled once: matched against every salt event tag in the main loop
+SALT_JOB_RETURN_RE = re.compile("^salt/job/\d+/ret/[^/]+$")
+
 
 class ClusterUnavailable(Exception):
     pass
@@ -96,6 +100,13 @@ class SyncObjects(object):
             ))
             self.fetch(reported_by, sync_type)
 
+    @property
+    @memoize
+    def _salt_client(self):
+        # Constructing a LocalClient means parsing the salt config and setting
+        # up transport, so do it once per SyncObjects rather than per fetch.
+        return LocalClient(config.get('cthulhu', 'salt_config_path'))
+
     def fetch(self, minion_id, sync_type):
         log.debug("SyncObjects.fetch: %s/%s" % (minion_id, sync_type))
         if minion_id is None:
@@ -104,12 +115,11 @@ class SyncObjects(object):
             return
 
         self._fetching_at[sync_type] = now()
-        client = LocalClient(config.get('cthulhu', 'salt_config_path'))
         # TODO clean up unused 'since' argument
-        pub_data = client.run_job(minion_id, 'ceph.get_cluster_object',
-                                  condition_kwarg([], {'cluster_name': self._cluster_name,
-                                                       'sync_type': sync_type.str,
-                                                       'since': None}))
+        pub_data = self._salt_client.run_job(minion_id, 'ceph.get_cluster_object',
+                                             condition_kwarg([], {'cluster_name': self._cluster_name,
+                                                                  'sync_type': sync_type.str,
+                                                                  'since': None}))
         if not pub_data:
             log.error("Failed to start fetch job %s/%s" % (minion_id, sync_type))
             # Don't throw an exception because if a fetch fails we should always
@@ -239,7 +249,7 @@ class ClusterMonitor(gevent.greenlet.Greenlet):
                     if tag.startswith("ceph/cluster/{0}".format(self.fsid)):
                         # A ceph.heartbeat beacon
                         self.on_heartbeat(data['id'], data['data'])
-                    elif re.match("^salt/job/\d+/ret/[^/]+$", tag):
+                    elif SALT_JOB_RETURN_RE.match(tag):
                         if data['fun'] == "saltutil.running":
                             # Update on what jobs are running
                             # It would be nice to filter these down to those which really are for
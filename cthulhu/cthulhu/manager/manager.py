@@ -59,6 +59,10 @@ except ImportError:
     manhole = None
 
 
+# Compiled once: matched against every salt event tag in TopLevelEvents
+SALT_JOB_RETURN_RE = re.compile("^salt/job/\d+/ret/[^/]+$")
+
+
 class ProcessMonitorThread(gevent.greenlet.Greenlet):
     CARBON_HOST = "localhost"
     CARBON_PORT = 2003
@@ -136,7 +140,7 @@ class TopLevelEvents(gevent.greenlet.Greenlet):
                         else:
                             log.debug("%s: heartbeat from existing cluster %s" % (
                                 self.__class__.__name__, cluster_data['fsid']))
-                    elif re.match("^salt/job/\d+/ret/[^/]+$", tag):
+                    elif SALT_JOB_RETURN_RE.match(tag):
                         if data['fun'] == 'saltutil.running':
                             self._manager.requests.on_tick_response(data['id'], data['return'])
                         else:
@@ -38,7 +38,7 @@ class PluginMonitor(gevent.greenlet.Greenlet):
 
         if os.path.exists(plugin_path):
             for plugin in os.listdir(plugin_path):
-                plugin = plugin.split('.')[0]
+                plugin = plugin.partition('.')[0]
                 if plugin in ('__init__', 'README'):
                     continue
 
@@ -126,11 +126,8 @@ class PoolRequestFactory(RequestFactory):
         commands = [('osd pool create', {'pool': attributes['name'], 'pg_num': attributes['pg_num']})]
 
         # Which attributes must we set after the initial create?
-        post_create_attrs = attributes.copy()
-        del post_create_attrs['name']
-        del post_create_attrs['pg_num']
-        if 'pgp_num' in post_create_attrs:
-            del post_create_attrs['pgp_num']
+        post_create_attrs = dict((k, v) for (k, v) in attributes.items()
+                                 if k not in ('name', 'pg_num', 'pgp_num'))
 
         commands.extend(self._pool_attribute_commands(
             attributes['name'],
@@ -138,7 +135,7 @@ class PoolRequestFactory(RequestFactory):
         ))
 
         log.debug("Post-create attributes: %s" % post_create_attrs)
-        log.debug("Commands: %s" % post_create_attrs)
+        log.debug("Commands: %s" % commands)
 
         return PoolCreatingRequest(
             "Creating pool '{name}'".format(name=attributes['name']),
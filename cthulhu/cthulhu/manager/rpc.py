@@ -226,16 +226,16 @@ class RpcInterface(object):
         """
 
         cluster = self._fs_resolve(fs_id)
-        osd_map = cluster.get_sync_object_data(OsdMap)
-        if osd_map is None:
+        osd_map = cluster.get_sync_object(OsdMap)
+        if osd_map.data is None:
             return []
         if object_type == OSD:
-            result = osd_map['osds']
+            result = osd_map.data['osds']
             if 'id__in' in list_filter:
                 result = [o for o in result if o['osd'] in list_filter['id__in']]
             if 'pool' in list_filter:
                 try:
-                    osds_in_pool = cluster.get_sync_object(OsdMap).osds_by_pool[list_filter['pool']]
+                    osds_in_pool = osd_map.osds_by_pool[list_filter['pool']]
                 except KeyError:
                     raise NotFound("Pool {0} does not exist".format(list_filter['pool']))
                 else:
@@ -243,9 +243,9 @@ class RpcInterface(object):
 
             return result
         elif object_type == POOL:
-            return osd_map['pools']
+            return osd_map.data['pools']
         elif object_type == CRUSH_RULE:
-            return osd_map['crush']['rules']
+            return osd_map.data['crush']['rules']
         else:
             raise NotImplementedError(object_type)
 
@@ -4,7 +4,7 @@ While the cluster monitor pays attention to events about Ceph clusters (which
 span non-disjoint sets of servers), the server monitor just pays attention to
 individual hosts with no regard to the relations between them.
 """
-from collections import defaultdict
+from collections import defaultdict, deque
 import json
 import datetime
 from dateutil import tz
@@ -204,21 +204,19 @@ class ServerMonitor(greenlet.Greenlet):
         a logical server can have multiple CRUSH nodes with arbitrary names.
         """
         osd_tree = osd_map['tree']
-        nodes_by_id = dict((n["id"], n) for n in osd_tree["nodes"])
+
+        # Index the tree and pick out the host nodes in a single pass
+        nodes_by_id = {}
+        host_nodes = []
+        for node in osd_tree["nodes"]:
+            nodes_by_id[node["id"]] = node
+            if node["type"] == CRUSH_HOST_TYPE:
+                host_nodes.append(node)
 
         host_to_osd = defaultdict(list)
 
         osd_id_to_host = {}
 
-        def find_descendants(cursor, fn):
-            if fn(cursor):
-                return [cursor]
-            else:
-                found = []
-                for child_id in cursor['children']:
-                    found.extend(find_descendants(nodes_by_id[child_id], fn))
-                return found
-
         # This assumes that:
         # - The host and OSD types exist and have the names set
         #   in CRUSH_HOST_TYPE and CRUSH_OSD_TYPE
@@ -226,11 +224,17 @@ class ServerMonitor(greenlet.Greenlet):
         # - That hosts have the 'name' attribute set to their hostname
         # - That OSDs have the 'name' attribute set to osd.<osd id>
         # - That OSDs are not descendents of OSDs
-        for node in osd_tree["nodes"]:
-            if node["type"] == CRUSH_HOST_TYPE:
-                host = node["name"]
-                for osd in find_descendants(node, lambda c: c['type'] == CRUSH_OSD_TYPE):
-                    osd_id_to_host[osd["id"]] = host
+        for host_node in host_nodes:
+            host = host_node["name"]
+            # Iterative BFS rather than recursion: CRUSH trees can be deep
+            # and we visit every node beneath the host either way
+            pending = deque([host_node])
+            while pending:
+                cursor = pending.popleft()
+                if cursor['type'] == CRUSH_OSD_TYPE:
+                    osd_id_to_host[cursor["id"]] = host
+                else:
+                    pending.extend(nodes_by_id[child_id] for child_id in cursor['children'])
 
         for osd in osd_map['osds']:
             try:
@@ -419,7 +423,7 @@ class ServerMonitor(greenlet.Greenlet):
 
         boot_time = datetime.datetime.fromtimestamp(server_heartbeat['boot_time'], tz=tz.tzutc())
         if new_server:
-            hostname = self._get_grains(fqdn)['host']
+            # `hostname` was already looked up on the path that left new_server set
             server_state = ServerState(fqdn, hostname, managed=True,
                                        last_contact=now(), boot_time=boot_time,
                                        ceph_version=server_heartbeat['ceph_version'])
@@ -432,8 +436,12 @@ class ServerMonitor(greenlet.Greenlet):
             ))
             log.info("Saw server %s for the first time" % server_state)
 
+        # Accumulate changed fields and write them back with a single UPDATE
+        # rather than one round trip per field
+        update_attrs = {}
+
         server_state.last_contact = now()
-        self._persister.update_server(server_state.fqdn, last_contact=server_state.last_contact)
+        update_attrs['last_contact'] = server_state.last_contact
 
         if server_state.boot_time != boot_time:
             log.warn("{0} boot time changed, old {1} new {2}".format(
@@ -441,7 +449,7 @@ class ServerMonitor(greenlet.Greenlet):
             ))
             old_boot_time = server_state.boot_time
             server_state.boot_time = boot_time
-            self._persister.update_server(server_state.fqdn, boot_time=server_state.boot_time)
+            update_attrs['boot_time'] = server_state.boot_time
             if old_boot_time is not None:  # i.e. a reboot, not an unmanaged->managed transition
                 if server_state.boot_time < old_boot_time:
                     log.warn("Server boot time went backwards")
@@ -463,10 +471,12 @@ class ServerMonitor(greenlet.Greenlet):
                 pass
             else:
                 server_state.ceph_version = server_heartbeat['ceph_version']
-                self._persister.update_server(server_state.fqdn, ceph_version=server_state.ceph_version)
+                update_attrs['ceph_version'] = server_state.ceph_version
                 if not (new_server or newly_managed_server):
                     self._eventer.on_new_version(server_state)
 
+        self._persister.update_server(server_state.fqdn, **update_attrs)
+
         seen_id_tuples = set()
         for service_name, service in server_heartbeat['services'].items():
             id_tuple = ServiceId(service['fsid'], service['type'], service['id'])
@@ -609,11 +619,14 @@ class ServerMonitor(greenlet.Greenlet):
             log.info("delete_cluster: No services for FSID %s" % fsid)
             return
 
+        # Remove the cluster's services from the DB in one statement, rather
+        # than one DELETE round trip per service below
+        self._persister.delete_cluster_services(fsid)
+
         for service in self.fsid_services[fsid]:
             del self.services[service.id]
             if service.server_state:
                 del service.server_state.services[service.id]
-            self._persister.delete_service(service.id)
 
             # If we inferred a host from the OSD map for this cluster
             # then when the last service is gone the server should
@@ -651,21 +664,25 @@ class ServerMonitor(greenlet.Greenlet):
         frontend_addr = None
         backend_addr = None
 
+        # Built lazily so that servers with no mon services never pay for it
+        mons_by_name = None
+
         for service in services:
             if frontend_addr is None and service.service_type == 'mon':
                 # Go find the mon in the monmap and tell me its addr
                 mon_map = cluster.get_sync_object_data(MonMap)
                 if mon_map is not None:
-                    mon = [mon for mon in mon_map['mons'] if mon['name'] == service.service_id][0]
-                    frontend_addr = mon['addr'].split(":")[0]
+                    if mons_by_name is None:
+                        mons_by_name = dict((mon['name'], mon) for mon in mon_map['mons'])
+                    frontend_addr = mons_by_name[service.service_id]['addr'].partition(":")[0]
 
             if (frontend_addr is None or backend_addr is None) and service.service_type == 'osd':
                 # Go find the OSD in the OSD map and tell me its frontend and backend addrs
-                osd_map = cluster.get_sync_object_data(OsdMap)
-                if osd_map is not None:
-                    osd = [osd for osd in osd_map['osds'] if str(osd['osd']) == service.service_id][0]
-                    frontend_addr = osd['public_addr'].split(":")[0]
-                    backend_addr = osd['cluster_addr'].split(":")[0]
+                osd_map = cluster.get_sync_object(OsdMap)
+                if osd_map.data is not None:
+                    osd = osd_map.osds_by_id[int(service.service_id)]
+                    frontend_addr = osd['public_addr'].partition(":")[0]
+                    backend_addr = osd['cluster_addr'].partition(":")[0]
 
         return {
             'fqdn': server_state.fqdn,
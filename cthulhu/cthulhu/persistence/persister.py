@@ -36,6 +36,22 @@ class Persister(gevent.greenlet.Greenlet):
     that maintain the primary copy of state in memory, but also lazily update
     the DB so that they can recover from it on restart.
     """
+    # The public interface: for each name here, callers get a method which
+    # enqueues a call to the _-prefixed implementation for execution on
+    # the persister greenlet.
+    PERSIST_OPS = [
+        'update_sync_object',
+        'create_server',
+        'update_server',
+        'create_service',
+        'update_service',
+        'update_service_location',
+        'delete_service',
+        'delete_server',
+        'delete_cluster_services',
+        'save_events'
+    ]
+
     def __init__(self):
         super(Persister, self).__init__()
 
@@ -44,32 +60,18 @@ class Persister(gevent.greenlet.Greenlet):
 
         self._session = Session()
 
+        for op in self.PERSIST_OPS:
+            setattr(self, op, self._defer(getattr(self, "_%s" % op)))
+
         # Plumb the sqlalchemy logger into our cthulhu logger's output
         logging.getLogger('sqlalchemy.engine').setLevel(logging.getLevelName(config.get('cthulhu', 'db_log_level')))
         for handler in log.handlers:
             logging.getLogger('sqlalchemy.engine').addHandler(handler)
 
-    def __getattribute__(self, item):
-        """
-        Wrap functions with logging
-        """
-        if item.startswith('_'):
-            return object.__getattribute__(self, item)
-        else:
-            try:
-                return object.__getattribute__(self, item)
-            except AttributeError:
-                try:
-                    attr = object.__getattribute__(self, "_%s" % item)
-                    if callable(attr):
-                        def defer(*args, **kwargs):
-                            dc = DeferredCall(attr, args, kwargs)
-                            self._queue.put(dc)
-                        return defer
-                    else:
-                        return object.__getattribute__(self, item)
-                except AttributeError:
-                    return object.__getattribute__(self, item)
+    def _defer(self, fn):
+        def defer(*args, **kwargs):
+            self._queue.put(DeferredCall(fn, args, kwargs))
+        return defer
 
     def _update_sync_object(self, fsid, name, sync_type, version, when, data):
         self._session.add(SyncObject(fsid=fsid, cluster_name=name, sync_type=sync_type, version=version, when=when,
@@ -116,6 +118,13 @@ class Persister(gevent.greenlet.Greenlet):
     def _delete_server(self, fqdn):
         self._session.query(Server).filter_by(fqdn=fqdn).delete()
 
+    def _delete_cluster_services(self, fsid):
+        """
+        Remove all of a cluster's services in one DELETE, instead of
+        issuing a statement per service.
+        """
+        self._session.query(Service).filter_by(fsid=fsid).delete()
+
     def _save_events(self, events):
         for event in events:
             self._session.add(event)
@@ -125,20 +134,38 @@ class Persister(gevent.greenlet.Greenlet):
 
         while not self._complete.is_set():
             try:
-                data = self._queue.get(block=True, timeout=1)
+                batch = [self._queue.get(block=True, timeout=1)]
             except gevent.queue.Empty:
                 continue
-            else:
+
+            # Drain anything else that has built up, so that a burst of
+            # updates is flushed with a single commit
+            while True:
                 try:
+                    batch.append(self._queue.get_nowait())
+                except gevent.queue.Empty:
+                    break
+
+            try:
+                for data in batch:
                     data.fn(*data.args, **data.kwargs)
-                    self._session.commit()
-                except Exception:
-                    # Catch-all because all kinds of things can go wrong and our
-                    # behaviour is the same: log the exception, the data that
-                    # caused it, then try to go back to functioning.
-                    log.exception("Persister exception persisting data: %s" % (data.fn,))
-
-                    self._session.rollback()
+                self._session.commit()
+            except Exception:
+                self._session.rollback()
+
+                # Replay the batch one call at a time, so that one bad item
+                # doesn't take the rest of the batch down with it.
+                for data in batch:
+                    try:
+                        data.fn(*data.args, **data.kwargs)
+                        self._session.commit()
+                    except Exception:
+                        # Catch-all because all kinds of things can go wrong and our
+                        # behaviour is the same: log the exception, the data that
+                        # caused it, then try to go back to functioning.
+                        log.exception("Persister exception persisting data: %s" % (data.fn,))
+
+                        self._session.rollback()
 
     def stop(self):
         self._complete.set()
@@ -122,11 +122,14 @@ class Health(RPCView):
     serializer_class = ClusterHealthSerializer
 
     def get(self, request, fsid):
-        health = self.client.get_sync_object(fsid, 'health')
+        health = self.client.get_sync_object(fsid, 'health', async=True)
+        cluster = self.client.get_cluster(fsid, async=True)
+        health = health.get()
+        cluster = cluster.get()
         return Response(ClusterHealthSerializer(DataObject({
             'report': health,
-            'cluster_update_time': self.client.get_cluster(fsid)['update_time'],
-            'cluster_update_time_unix': self.client.get_cluster(fsid)['update_time'],
+            'cluster_update_time': cluster['update_time'],
+            'cluster_update_time_unix': cluster['update_time'],
         })).data)
 
 
@@ -135,11 +138,11 @@ class HealthCounters(RPCView):
 
     PG_FIELDS = ['pgid', 'acting', 'up', 'state']
 
-    CRIT_STATES = set(['stale', 'down', 'peering', 'inconsistent', 'incomplete', 'inactive'])
-    WARN_STATES = set(['creating', 'recovery_wait', 'recovering', 'replay',
-                       'splitting', 'degraded', 'remapped', 'scrubbing', 'repair',
-                       'wait_backfill', 'backfilling', 'backfill_toofull'])
-    OKAY_STATES = set(['active', 'clean'])
+    CRIT_STATES = frozenset(['stale', 'down', 'peering', 'inconsistent', 'incomplete', 'inactive'])
+    WARN_STATES = frozenset(['creating', 'recovery_wait', 'recovering', 'replay',
+                             'splitting', 'degraded', 'remapped', 'scrubbing', 'repair',
+                             'wait_backfill', 'backfilling', 'backfill_toofull'])
+    OKAY_STATES = frozenset(['active', 'clean'])
 
     @classmethod
     def generate(cls, osd_map, mds_map, mon_status, pg_summary):
@@ -179,16 +182,6 @@ class HealthCounters(RPCView):
             }
         }
 
-    @classmethod
-    def _pg_counter_helper(cls, states, classifier, count, stats):
-        matched_states = classifier.intersection(states)
-        if len(matched_states) > 0:
-            stats[0] += count
-            for state in matched_states:
-                stats[1][state] += count
-            return True
-        return False
-
     @classmethod
     def _calculate_pg_counters(cls, pg_summary):
         # Although the mon already has a copy of this (in 'status' output),
@@ -200,13 +193,26 @@ class HealthCounters(RPCView):
         pgs_by_state = pg_summary['all']
         ok, warn, crit = [[0, defaultdict(int)] for _ in range(3)]
         for state_name, count in pgs_by_state.items():
-            states = map(lambda s: s.lower(), state_name.split("+"))
-            if cls._pg_counter_helper(states, cls.CRIT_STATES, count, crit):
-                pass
-            elif cls._pg_counter_helper(states, cls.WARN_STATES, count, warn):
-                pass
-            elif cls._pg_counter_helper(states, cls.OKAY_STATES, count, ok):
-                pass
+            states = frozenset(s.lower() for s in state_name.split("+"))
+
+            # One intersection per classifier, most severe match wins
+            stats = None
+            matched_states = states & cls.CRIT_STATES
+            if matched_states:
+                stats = crit
+            else:
+                matched_states = states & cls.WARN_STATES
+                if matched_states:
+                    stats = warn
+                else:
+                    matched_states = states & cls.OKAY_STATES
+                    if matched_states:
+                        stats = ok
+
+            if stats is not None:
+                stats[0] += count
+                for state in matched_states:
+                    stats[1][state] += count
             else:
                 # Uncategorised state, assume it's critical.  This shouldn't usually
                 # happen, but want to avoid breaking if ceph adds a state.
@@ -240,16 +246,9 @@ class HealthCounters(RPCView):
             'up_not_in': 0,
             'up_in': 0
         }
+        counter_names = (('not_up_not_in', 'not_up_in'), ('up_not_in', 'up_in'))
         for osd in osds:
-            up, inn = osd['up'], osd['in']
-            if not up and not inn:
-                counters['not_up_not_in'] += 1
-            elif not up and inn:
-                counters['not_up_in'] += 1
-            elif up and not inn:
-                counters['up_not_in'] += 1
-            elif up and inn:
-                counters['up_in'] += 1
+            counters[counter_names[bool(osd['up'])][bool(osd['in'])]] += 1
         warn_count = counters['up_not_in'] + counters['not_up_in']
         warn_states = {}
         if counters['up_not_in'] > 0:
@@ -288,16 +287,18 @@ class HealthCounters(RPCView):
         mds_data = self.client.get_sync_object(fsid, MdsMap.str, async=True)
         pg_summary = self.client.get_sync_object(fsid, PgSummary.str, async=True)
         mon_status = self.client.get_sync_object(fsid, MonStatus.str, async=True)
+        cluster = self.client.get_cluster(fsid, async=True)
         mds_data = mds_data.get()
         osd_data = osd_data.get()
         pg_summary = pg_summary.get()
         mon_status = mon_status.get()
+        cluster = cluster.get()
 
         counters = self.generate(osd_data, mds_data, mon_status, pg_summary)
 
         return Response(ClusterHealthCountersSerializer(DataObject({
             'counters': counters,
-            'cluster_update_time': self.client.get_cluster(fsid)['update_time']
+            'cluster_update_time': cluster['update_time']
         })).data)
 
 
@@ -323,7 +324,7 @@ class OSDList(RPCView):
         anything like a .save() on this instance; it's just a vehicle for the
         filtered OSDs.
         """
-        pg_states = set(map(lambda s: s.lower(), pg_states.split(",")))
+        pg_states = set(s.lower() for s in pg_states.split(","))
         target_osds = set([])
         for state, state_osds in osds_by_pg_state.iteritems():
             if state in pg_states:
@@ -334,11 +335,11 @@ class OSDList(RPCView):
         fqdn_to_server = dict([(s['fqdn'], s) for s in servers])
 
         # map osd id to pg states
-        pg_states_by_osd = defaultdict(lambda: defaultdict(lambda: 0))
+        pg_states_by_osd = defaultdict(lambda: defaultdict(int))
         # map osd id to set of pools
-        pools_by_osd = defaultdict(lambda: set([]))
+        pools_by_osd = defaultdict(set)
         # map pg state to osd ids
-        osds_by_pg_state = defaultdict(lambda: set([]))
+        osds_by_pg_state = defaultdict(set)
 
         # get the list of pools
         pools_by_id = dict((p_id, p['pool_name']) for (p_id, p) in osd_map.pools_by_id.items())
@@ -361,14 +362,14 @@ class OSDList(RPCView):
         def fixup_osd(osd):
             osd_id = osd['osd']
             data = dict((k, osd[k]) for k in self.OSD_FIELDS)
-            data.update({'id': osd_id})
-            data.update({'osd': osd_id})
-            data.update({'pg_states': dict(pg_states_by_osd[osd_id])})
-            data.update({'pools': list(pools_by_osd[osd_id])})
+            data['id'] = osd_id
+            data['osd'] = osd_id
+            data['pg_states'] = dict(pg_states_by_osd[osd_id])
+            data['pools'] = list(pools_by_osd[osd_id])
 
             return data
 
-        osds = map(fixup_osd, osd_map.osds_by_id.values())
+        osds = [fixup_osd(osd) for osd in osd_map.osds_by_id.values()]
 
         # Apply the ServerMonitor data
         for o, (service_id, fqdn) in zip(osds, service_to_server):
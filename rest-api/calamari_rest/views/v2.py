@@ -398,12 +398,26 @@ but those without static defaults will be set to null.
         return Response(delete_response, status=status.HTTP_202_ACCEPTED)
 
     def _validate_semantics(self, fsid, pool_id, data):
+        # Issue overlapped RPCs for everything the checks will need, rather
+        # than letting each check make its own blocking call
+        pools = self.client.list(fsid, POOL, {}, async=True) if 'name' in data else None
+        rules = self.client.list(fsid, CRUSH_RULE, {}, async=True) if 'crush_ruleset' in data else None
+        detail = self.client.get(fsid, POOL, int(pool_id), async=True) if pool_id is not None else None
+        ceph_config = self.client.get_sync_object(fsid, 'config', async=True)
+        if pools is not None:
+            pools = pools.get()
+        if rules is not None:
+            rules = rules.get()
+        if detail is not None:
+            detail = detail.get()
+        ceph_config = ceph_config.get()
+
         errors = defaultdict(list)
-        self._check_name_unique(fsid, data, errors)
-        self._check_crush_ruleset(fsid, data, errors)
+        self._check_name_unique(pools, data, errors)
+        self._check_crush_ruleset(rules, data, errors)
         self._check_pgp_less_than_pg_num(data, errors)
-        self._check_pg_nums_dont_decrease(fsid, pool_id, data, errors)
-        self._check_pg_num_inside_config_bounds(fsid, data, errors)
+        self._check_pg_nums_dont_decrease(detail, data, errors)
+        self._check_pg_num_inside_config_bounds(ceph_config, data, errors)
 
         if errors.items():
             if 'name' in errors:
@@ -411,23 +425,20 @@ but those without static defaults will be set to null.
             else:
                 return Response(errors, status=status.HTTP_400_BAD_REQUEST)
 
-    def _check_pg_nums_dont_decrease(self, fsid, pool_id, data, errors):
-        if pool_id is not None:
-            detail = self.client.get(fsid, POOL, int(pool_id))
+    def _check_pg_nums_dont_decrease(self, detail, data, errors):
+        if detail is not None:
             for field in ['pg_num', 'pgp_num']:
                 expanded_field = 'pg_placement_num' if field == 'pgp_num' else 'pg_num'
                 if field in data and data[field] < detail[expanded_field]:
                     errors[field].append('must be >= than current {field}'.format(field=field))
 
-    def _check_crush_ruleset(self, fsid, data, errors):
+    def _check_crush_ruleset(self, rules, data, errors):
         if 'crush_ruleset' in data:
-            rules = self.client.list(fsid, CRUSH_RULE, {})
             rulesets = set(r['ruleset'] for r in rules)
             if data['crush_ruleset'] not in rulesets:
                 errors['crush_ruleset'].append("CRUSH ruleset {0} not found".format(data['crush_ruleset']))
 
-    def _check_pg_num_inside_config_bounds(self, fsid, data, errors):
-        ceph_config = self.client.get_sync_object(fsid, 'config')
+    def _check_pg_num_inside_config_bounds(self, ceph_config, data, errors):
         if not ceph_config:
             return Response("Cluster configuration unavailable", status=status.HTTP_503_SERVICE_UNAVAILABLE)
         if 'pg_num' in data and data['pg_num'] > int(ceph_config['mon_max_pool_pg_num']):
@@ -437,8 +448,8 @@ but those without static defaults will be set to null.
         if 'pgp_num' in data and 'pg_num' in data and data['pg_num'] < data['pgp_num']:
             errors['pgp_num'].append('must be >= to pg_num')
 
-    def _check_name_unique(self, fsid, data, errors):
-        if 'name' in data and data['name'] in [x.pool_name for x in [PoolDataObject(p) for p in self.client.list(fsid, POOL, {})]]:
+    def _check_name_unique(self, pools, data, errors):
+        if 'name' in data and data['name'] in [x.pool_name for x in [PoolDataObject(p) for p in pools]]:
             errors['name'].append('Pool with name {name} already exists'.format(name=data['name']))
 
 
@@ -523,16 +534,19 @@ Filtering is available on this resource:
 
     @csrf_exempt
     def retrieve(self, request, fsid, osd_id):
-        osd = self.client.get_sync_object(fsid, 'osd_map', ['osds_by_id', int(osd_id)])
-        crush_node = self.client.get_sync_object(fsid, 'osd_map', ['osd_tree_node_by_id', int(osd_id)])
+        # Issue overlapped RPCs, then await all the data
+        osd = self.client.get_sync_object(fsid, 'osd_map', ['osds_by_id', int(osd_id)], async=True)
+        crush_node = self.client.get_sync_object(fsid, 'osd_map', ['osd_tree_node_by_id', int(osd_id)], async=True)
+        server_info = self.client.server_by_service([ServiceId(fsid, OSD, osd_id)], async=True)
+        pools = self.client.get_sync_object(fsid, 'osd_map', ['osd_pools', int(osd_id)], async=True)
+        osd_commands = self.client.get_valid_commands(fsid, OSD, [int(osd_id)], async=True)
+
+        osd = osd.get()
+        crush_node = crush_node.get()
         osd['reweight'] = float(crush_node['reweight'])
-        osd['server'] = self.client.server_by_service([ServiceId(fsid, OSD, osd_id)])[0][1]
-
-        pools = self.client.get_sync_object(fsid, 'osd_map', ['osd_pools', int(osd_id)])
-        osd['pools'] = pools
-
-        osd_commands = self.client.get_valid_commands(fsid, OSD, [int(osd_id)])
-        osd.update(osd_commands[int(osd_id)])
+        osd['server'] = server_info.get()[0][1]
+        osd['pools'] = pools.get()
+        osd.update(osd_commands.get()[int(osd_id)])
 
         return Response(self.serializer_class(DataObject(osd)).data)
 
@@ -11,17 +11,17 @@ log = logging.getLogger(__name__)
 
 def fake_list(fsid, type, filter, **kwargs):
     if type == POOL:
-        return [{'pool_name': 'data',
-                 'pg_placement_num': 64,
-                 'pg_num': 64,
-                 'type': 1,
-                 'pool': 0,
-                 'size': 2}
-                ]
+        return fake_async([{'pool_name': 'data',
+                            'pg_placement_num': 64,
+                            'pg_num': 64,
+                            'type': 1,
+                            'pool': 0,
+                            'size': 2}
+                           ])
     elif type == CRUSH_RULE:
-        return [{
+        return fake_async([{
             'ruleset': 0
-        }]
+        }])
     else:
         raise NotImplementedError()
 
@@ -37,8 +37,8 @@ class TestPoolValidation(TestCase):
             self.pvs.client = mock.MagicMock()
             self.pvs.client.list = fake_list
             self.pvs.client.create.return_value = ['request_id']
-            self.pvs.client.get.return_value = fake_list("abc", POOL, {})[0]
-            self.pvs.client.get_sync_object.return_value = {'mon_max_pool_pg_num': 65535}
+            self.pvs.client.get.return_value = fake_async(fake_list("abc", POOL, {}).get()[0])
+            self.pvs.client.get_sync_object.return_value = fake_async({'mon_max_pool_pg_num': 65535})
 
     def test_create_duplicate_names_fails_validation(self):
         self.request.DATA = {'name': 'data', 'pg_num': 64}
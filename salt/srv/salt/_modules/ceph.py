@@ -21,6 +21,10 @@ RADOS_TIMEOUT = 20
 # present, although this is the case on a nicely ceph-deploy'd system
 RADOS_NAME = 'client.admin'
 
+# Admin socket filenames are "<cluster name>-<service type>.<service id>.asok";
+# compiled once as service_status runs per socket per heartbeat
+ASOK_NAME_RE = re.compile("^(.*)-(.*)\.(.*).asok$")
+
 
 def fire_event(data, tag):
     """
@@ -179,6 +183,11 @@ def pg_summary(pgs_brief):
     pools = {}
     all_pgs = {}
     for pg in pgs_brief:
+        # Look these up once per PG: this loop runs tens of thousands of
+        # times on a big cluster
+        state = pg['state']
+        pool = int(pg['pgid'].partition('.')[0])
+
         for osd in pg['acting']:
             try:
                 osd_stats = osds[osd]
@@ -187,11 +196,10 @@ def pg_summary(pgs_brief):
                 osds[osd] = osd_stats
 
             try:
-                osd_stats[pg['state']] += 1
+                osd_stats[state] += 1
             except KeyError:
-                osd_stats[pg['state']] = 1
+                osd_stats[state] = 1
 
-        pool = int(pg['pgid'].split('.')[0])
         try:
             pool_stats = pools[pool]
         except KeyError:
@@ -199,14 +207,14 @@ def pg_summary(pgs_brief):
             pools[pool] = pool_stats
 
         try:
-            pool_stats[pg['state']] += 1
+            pool_stats[state] += 1
         except KeyError:
-            pool_stats[pg['state']] = 1
+            pool_stats[state] = 1
 
         try:
-            all_pgs[pg['state']] += 1
+            all_pgs[state] += 1
         except KeyError:
-            all_pgs[pg['state']] = 1
+            all_pgs[state] = 1
 
     return {
         'by_osd': osds,
@@ -469,7 +477,7 @@ def service_status(socket_path):
     """
     Given an admin socket path, learn all we can about that service
     """
-    cluster_name, service_type, service_id = re.match("^(.*)-(.*)\.(.*).asok$", os.path.basename(socket_path)).groups()
+    cluster_name, service_type, service_id = ASOK_NAME_RE.match(os.path.basename(socket_path)).groups()
     # Interrogate the service for its FSID
     config = json.loads(admin_socket(socket_path, ['config', 'get', 'fsid'], 'json'))
     fsid = config['fsid']